@@ -887,7 +887,12 @@ class Airplane:
             raise IOError("'airfoils' must be a string or dict.")
 
         for key in airfoil_dict:
-            self._airfoil_database[key] = Airfoil(key, airfoil_dict[key])
+
+            # Already constructed airfoils may be shared between aircraft
+            if isinstance(airfoil_dict[key], Airfoil):
+                self._airfoil_database[key] = airfoil_dict[key]
+            else:
+                self._airfoil_database[key] = Airfoil(key, airfoil_dict[key])
 
 
     def set_control_state(self, control_state={}):
@@ -2,6 +2,7 @@
 import json
 import os
 import warnings
+import functools
 
 import scipy.integrate as integ
 import scipy.interpolate as interp
@@ -15,6 +16,10 @@ from machupX.dxf import dxf
 from airfoil_db.exceptions import DatabaseBoundsError
 
 
+# Gauss-Legendre nodes and weights used for integrating the quarter-chord line
+_GAUSS_NODES, _GAUSS_WEIGHTS = np.polynomial.legendre.leggauss(20)
+
+
 class WingSegment:
     """A class defining a segment of a lifting surface.
 
@@ -58,6 +63,9 @@ class WingSegment:
         self._origin = np.asarray(origin)
 
         self._attached_segments = {}
+        if name == "origin":
+            self._segments_by_ID = {} # Keyed by (ID, side), since mirrored segments share an ID
+            self._segments_by_name = {}
         self._getter_data = {}
         
         self.ID = self._input_dict.get("ID")
@@ -77,8 +85,9 @@ class WingSegment:
             self._setup_control_surface(self._input_dict.get("control_surface", None))
 
             # These make repeated calls for geometry information faster. Should be called again if geometry changes.
-            self._setup_cp_data()
+            # The node data must be set up first, as the control point data depend on the node chords.
             self._setup_node_data()
+            self._setup_cp_data()
 
             # Get CAD options
             self._cad_options = self._input_dict.get("CAD_options", {})
@@ -309,36 +318,12 @@ class WingSegment:
             # Extract dihedral from qc points using central differencing
             def get_dihedral(span):
 
-                # Convert input to array
-                converted = False
-                if isinstance(span, float):
-                    converted = True
-                    span = np.asarray(span)[np.newaxis]
+                # Get two points near each span location of interest
+                p0, p1 = self._get_qc_differencing_points(span)
 
                 # Calculate dihedral
-                dihedral = np.zeros_like(span)
-                for i, s in enumerate(span):
-
-                    # Get two points near span location of interest
-                    if s < 0.005:
-                        p0 = self._get_quarter_chord_loc(s)
-                        p1 = self._get_quarter_chord_loc(s+0.01)
-                    elif s > 0.995:
-                        p0 = self._get_quarter_chord_loc(s-0.01)
-                        p1 = self._get_quarter_chord_loc(s)
-                    else:
-                        p0 = self._get_quarter_chord_loc(s-0.005)
-                        p1 = self._get_quarter_chord_loc(s+0.005)
-
-                    # Calculate dihedral
-                    dihedral[i] = np.arctan((p1[2]-p0[2])/(p1[1]-p0[1]))
-
-                # Convert back to float if needed
-                if converted:
-                    span = span.item()
-                    return dihedral.item()
-                else:
-                    return dihedral
+                dihedral = np.arctan((p1[:,2]-p0[:,2])/(p1[:,1]-p0[:,1]))
+                return dihedral.reshape(np.shape(span))[()]
 
             self.get_dihedral = get_dihedral
 
@@ -364,36 +349,12 @@ class WingSegment:
             # Extract sweep from qc points using central differencing
             def get_sweep(span):
 
-                # Convert input to array
-                converted = False
-                if isinstance(span, float):
-                    converted = True
-                    span = np.asarray(span)[np.newaxis]
+                # Get two points near each span location of interest
+                p0, p1 = self._get_qc_differencing_points(span)
 
                 # Calculate sweep
-                sweep = np.zeros_like(span)
-                for i, s in enumerate(span):
-
-                    # Get two points near span location of interest
-                    if s < 0.005:
-                        p0 = self._get_quarter_chord_loc(s)
-                        p1 = self._get_quarter_chord_loc(s+0.01)
-                    elif s > 0.995:
-                        p0 = self._get_quarter_chord_loc(s-0.01)
-                        p1 = self._get_quarter_chord_loc(s)
-                    else:
-                        p0 = self._get_quarter_chord_loc(s-0.005)
-                        p1 = self._get_quarter_chord_loc(s+0.005)
-
-                    # Calculate sweep
-                    sweep[i] = -np.arctan((p1[0]-p0[0])/(np.sqrt((p1[1]-p0[1]))**2 + (p1[2]-p0[2])**2))
-
-                # Convert back to float if needed
-                if converted:
-                    span = span.item()
-                    return sweep.item()
-                else:
-                    return sweep
+                sweep = -np.arctan((p1[:,0]-p0[:,0])/(np.sqrt((p1[:,1]-p0[:,1]))**2 + (p1[:,2]-p0[:,2])**2))
+                return sweep.reshape(np.shape(span))[()]
 
             self.get_sweep = get_sweep
 
@@ -432,6 +393,15 @@ class WingSegment:
             self.get_chord = self._build_getter_linear_f_of_span(chord_data, "chord")
             
 
+    def _get_qc_differencing_points(self, span):
+        # Returns pairs of quarter-chord points about the given span locations for central differencing.
+        # Forward and backward differences are used near the root and tip, respectively.
+        span = np.atleast_1d(span)
+        s0 = np.where(span < 0.005, span, np.where(span > 0.995, span-0.01, span-0.005))
+        s1 = np.where(span < 0.005, span+0.01, np.where(span > 0.995, span, span+0.005))
+        return self._get_quarter_chord_loc(s0), self._get_quarter_chord_loc(s1)
+
+
     def _add_discontinuities(self, data, discont):
         # Finds discontinuities in the data (i.e. any change in linear distribution)
 
@@ -450,30 +420,17 @@ class WingSegment:
             else:
                 self._getter_data[name] = data
 
+            # Bind the value (with the sign reversed if needed) so it is not looked up on every call
+            value = -self._getter_data[name] if flip_sign else self._getter_data[name]
+
             def getter(span):
                 """
                 span : float or ndarray
                     Non-dimensional span location.
                 """
 
-                # Make input an array
-                converted = False
-                if isinstance(span, float):
-                    converted = True
-                    span = np.asarray(span)[np.newaxis]
-
-                # Reverse sign
-                if flip_sign:
-                    data = -np.full(span.shape, self._getter_data[name])
-                else:
-                    data = np.full(span.shape, self._getter_data[name])
-
-                # Convert back to scalar if needed
-                if converted:
-                    span = span.item()
-                    return data.item()
-                else:
-                    return data
+                # Indexing with an empty tuple returns a scalar for scalar input and the array otherwise
+                return np.full(np.shape(span), value)[()]
 
         
         else: # Array
@@ -484,7 +441,14 @@ class WingSegment:
                     new_data[i,1] = data[i][1]
                 data = new_data
 
-            self._getter_data[name] = np.copy(data)
+            # Angular data are converted to radians once here rather than on every call
+            self._getter_data[name] = np.array(data, dtype=float)
+            if angular_data:
+                self._getter_data[name][:,1] = np.radians(self._getter_data[name][:,1])
+
+            # Bind the table (with the sign reversed if needed) so it is not looked up on every call
+            xp = np.ascontiguousarray(self._getter_data[name][:,0])
+            fp = np.ascontiguousarray(-self._getter_data[name][:,1] if flip_sign else self._getter_data[name][:,1])
 
             def getter(span):
                 """
@@ -492,28 +456,8 @@ class WingSegment:
                     Non-dimensional span location.
                 """
 
-                # Convert input to array
-                converted = False
-                if isinstance(span, float):
-                    converted = True
-                    span = np.asarray(span)[np.newaxis]
-
                 # Perform interpolation
-                if angular_data:
-                    data = np.interp(span, self._getter_data[name][:,0], np.radians(self._getter_data[name][:,1]))
-                else:
-                    data = np.interp(span, self._getter_data[name][:,0], self._getter_data[name][:,1])
-
-                # Reverse data
-                if flip_sign:
-                    data = -data
-
-                # Convert back to scalar if needed
-                if converted:
-                    span = span.item()
-                    return data.item()
-                else:
-                    return data
+                return np.interp(span, xp, fp)
 
         return getter
 
@@ -532,7 +476,7 @@ class WingSegment:
         # Initializes distributions of unit normal, spanwise, and axial vectors for quick access later
 
         # Determine cumulative length along the LAC
-        ac_loc = self._get_ll_loc(self.node_span_locs)
+        ac_loc = self.nodes
         d_ac_loc = np.diff(ac_loc, axis=0)
         ds = np.zeros(self.N+1)
         ds[1:] = np.cumsum(np.linalg.norm(d_ac_loc, axis=1))
@@ -543,7 +487,7 @@ class WingSegment:
         self._get_span_vec = interp.interp1d(self.node_span_locs, self._u_s_dist, axis=0)
 
         # Unit axial vector
-        u_a_unswept = self._get_unswept_axial_vec(self.node_span_locs)
+        u_a_unswept = self._u_a_node_unswept
         k = np.einsum('ij,ij->i', self._u_s_dist, u_a_unswept)
         c1 = np.sqrt(1/(1-k*k))
         c2 = -c1*k
@@ -582,18 +526,23 @@ class WingSegment:
 
         elif isinstance(airfoil, np.ndarray): # Distribution of airfoils
 
-            # Store each airfoil and its span location
-            for row in airfoil:
-
-                name = row[1].item()
+            # Get span locations and names of the airfoils
+            if airfoil.dtype.names is not None: # Structured array read in from a file
+                spans, names = (airfoil[field] for field in airfoil.dtype.names[:2])
+            else:
+                spans, names = airfoil[:,0], airfoil[:,1]
 
-                try:
-                    self._airfoils.append(airfoil_dict[name])
-                except KeyError:
-                    raise IOError("'{0}' must be specified in 'airfoils'.".format(name))
+            # Store each airfoil and its span location
+            try:
+                self._airfoils = [airfoil_dict[name] for name in names]
+            except KeyError as e:
+                raise IOError("'{0}' must be specified in 'airfoils'.".format(e.args[0]))
+            self._airfoil_spans = np.asarray(spans, dtype=float)
+            self._num_airfoils = len(self._airfoils)
 
-                self._airfoil_spans.append(float(row[0]))
-                self._num_airfoils += 1
+            # Make sure the airfoils are specified along the whole segment, as properties are not extrapolated
+            if self._airfoil_spans[0] != 0.0 or self._airfoil_spans[-1] != 1.0:
+                raise IOError("Airfoil distribution for wing segment {0} must begin at 0.0 and end at 1.0 span.".format(self.name))
 
             # Determine control points within each airfoil span
             self._airfoil_slices = []
@@ -618,6 +567,12 @@ class WingSegment:
                     self._airfoil_slices.append(slice(num_greater, prev_slice_end))
                     prev_slice_end = num_greater
 
+            # Determine the control points at which each airfoil must be evaluated (i.e. the spans on either side of it)
+            self._airfoil_eval_slices = []
+            for j in range(self._num_airfoils):
+                neighbors = self._airfoil_slices[max(j-1, 0):j+1]
+                self._airfoil_eval_slices.append(slice(min(s.start for s in neighbors), max(s.stop for s in neighbors)))
+
         else:
             raise IOError("Airfoil definition must a be a string or an array.")
 
@@ -641,7 +596,16 @@ class WingSegment:
             self._cntrl_root_span = control_dict.get("root_span", 0.0)
             self._cntrl_tip_span = control_dict.get("tip_span", 1.0)
             self._saturation_angle = np.radians(control_dict.get("saturation_angle", np.inf))
-            self._cp_in_cntrl_surf = (self.cp_span_locs >= self._cntrl_root_span) & (self.cp_span_locs <= self._cntrl_tip_span)
+
+            # The control points are ordered by span (reversed on the left side), so those within the control surface form a contiguous slice
+            if self.side == "left":
+                lo = np.searchsorted(self.cp_span_locs[::-1], self._cntrl_root_span, side="left")
+                hi = np.searchsorted(self.cp_span_locs[::-1], self._cntrl_tip_span, side="right")
+                self._cp_cntrl_slice = slice(self.N-hi, self.N-lo)
+            else:
+                lo = np.searchsorted(self.cp_span_locs, self._cntrl_root_span, side="left")
+                hi = np.searchsorted(self.cp_span_locs, self._cntrl_tip_span, side="right")
+                self._cp_cntrl_slice = slice(lo, hi)
 
             # Get chord data
             chord_data = import_value("chord_fraction", control_dict, self._unit_sys, 0.25)
@@ -653,10 +617,12 @@ class WingSegment:
 
             # Determine the flap chord fractions at each control point
             self.get_c_f = self._build_getter_linear_f_of_span(chord_data, "flap_chord_fraction")
-            self._cp_c_f[self._cp_in_cntrl_surf] = self.get_c_f(self.cp_span_locs[self._cp_in_cntrl_surf])
+            self._cp_c_f[self._cp_cntrl_slice] = self.get_c_f(self.cp_span_locs[self._cp_cntrl_slice])
 
             # Store mixing
             self._control_mixing = control_dict.get("control_mixing", {})
+            self._control_keys = list(self._control_mixing.keys())
+            self._control_mixing_gains = np.array([self._control_mixing[key] for key in self._control_keys])
             is_sealed = control_dict.get("is_sealed", True)
 
             # TODO: Use sealed definition
@@ -675,20 +641,25 @@ class WingSegment:
             ## Determine flap efficiency for changing moment coef
             #self._Cm_delta_flap = (np.sin(2*theta_f)-2*np.sin(theta_f))/4
 
+        # Initialize airfoil coefficient getters
+        self._specialize_airfoil_getters()
+
 
     def _setup_cp_data(self):
         # Creates and stores vectors of important data at each control point
         self.u_a_cp = self._get_axial_vec(self.cp_span_locs)
         self.u_n_cp = self._get_normal_vec(self.cp_span_locs)
         self.u_s_cp = self._get_span_vec(self.cp_span_locs)
-        self.u_a_cp_unswept = self._get_unswept_axial_vec(self.cp_span_locs)
-        self.u_n_cp_unswept = self._get_unswept_normal_vec(self.cp_span_locs)
-        self.u_s_cp_unswept = self._get_unswept_span_vec(self.cp_span_locs)
-        self.c_bar_cp = self._get_cp_avg_chord_lengths()
         self.dihedral_cp = self.get_dihedral(self.cp_span_locs)
         self.sweep_cp = self.get_sweep(self.cp_span_locs)
         self.twist_cp = self.get_twist(self.cp_span_locs)
-        self.dS = abs(self.node_span_locs[1:]-self.node_span_locs[:-1])*self.b*self.c_bar_cp
+        self.u_a_cp_unswept, self.u_n_cp_unswept, self.u_s_cp_unswept = self._get_unswept_vecs(self.twist_cp, self.dihedral_cp)
+        self.c_bar_cp = self._get_cp_avg_chord_lengths()
+        self.dS = np.empty(self.N)
+        np.subtract(self.node_span_locs[1:], self.node_span_locs[:-1], out=self.dS)
+        np.abs(self.dS, out=self.dS)
+        self.dS *= self.b
+        self.dS *= self.c_bar_cp
 
         # Store airfoil thickness and camber for swept section corrections
         max_cambers = np.zeros(self._num_airfoils)
@@ -704,8 +675,15 @@ class WingSegment:
             self.max_camber_cp = np.interp(self.cp_span_locs, self._airfoil_spans, max_cambers)
             self.max_thickness_cp = np.interp(self.cp_span_locs, self._airfoil_spans, max_thicknesses)
 
+            # Store weights for interpolating between airfoils, since the control points do not move
+            self._airfoil_interp_d = np.zeros(self.N)
+            for j, cur_slice in enumerate(self._airfoil_slices):
+                self._airfoil_interp_d[cur_slice] = (self.cp_span_locs[cur_slice]-self._airfoil_spans[j])/(self._airfoil_spans[j+1]-self._airfoil_spans[j])
+            self._airfoil_interp_1md = 1.0-self._airfoil_interp_d
+
 
     def _setup_node_data(self):
+        # Creates and stores vectors of important data at each node
         self.u_a_node = self._get_axial_vec(self.node_span_locs)
         self.c_node = self.get_chord(self.node_span_locs)
 
@@ -797,8 +775,9 @@ class WingSegment:
         # Store control points
         self.control_points = self._get_ll_loc(self.cp_span_locs)
 
-        # Store nodes on AC
-        self.nodes = self._get_ll_loc(self.node_span_locs)
+        # Store nodes on AC. The unswept axial vector at the nodes is kept for initializing the unit vector distributions.
+        self._u_a_node_unswept = self._get_unswept_axial_vec(self.node_span_locs)
+        self.nodes = self._ll_loc_from_fields(self.node_span_locs, self.get_chord(self.node_span_locs), self._u_a_node_unswept)
 
 
     def attach_wing_segment(self, new_segment_name, input_dict, side, unit_sys, airfoil_dict):
@@ -831,74 +810,59 @@ class WingSegment:
         if self.ID != 0:
             raise RuntimeError("Segments can only be added at the origin segment.")
 
+        # Find the parent segment
+        parent_ID = input_dict.get("connect_to", {}).get("ID", 0)
+        if parent_ID == 0:
+            parent = self
         else:
-            return self._attach_wing_segment(new_segment_name, input_dict, side, unit_sys, airfoil_dict)
+            try:
+                parent = self._segments_by_ID[(parent_ID, side)]
+            except KeyError:
+                raise RuntimeError("Could not attach wing segment {0}. Check ID of parent is valid.".format(new_segment_name))
 
+        # Attach
+        new_segment = parent._attach_wing_segment(new_segment_name, input_dict, side, unit_sys, airfoil_dict)
 
-    def _attach_wing_segment(self, new_segment_name, input_dict, side, unit_sys, airfoil_dict):
-        # Recursive function for attaching a wing segment.
+        # Store reference. For mirrored wing segments, a right segment only ever attaches to a right segment and
+        # same with left. Any segment may attach to a segment which is not mirrored.
+        self._segments_by_name[new_segment_name] = new_segment
+        if new_segment.has_mirror:
+            self._segments_by_ID[(new_segment.ID, side)] = new_segment
+        else:
+            self._segments_by_ID.setdefault((new_segment.ID, "left"), new_segment)
+            self._segments_by_ID.setdefault((new_segment.ID, "right"), new_segment)
 
-        connect_dict = input_dict.get("connect_to", {})
-        parent_ID = connect_dict.get("ID", 0)
+        return new_segment
 
-        # Check this ID matches the ID of the one we want to attach to
-        if self.ID == parent_ID:
 
-            # For mirrored wing segments, a right segment only ever attaches to a right segment and same with left
-            if self.has_mirror and side not in self.name:
-                return False
+    def _attach_wing_segment(self, new_segment_name, input_dict, side, unit_sys, airfoil_dict):
+        # Attaches a wing segment directly to this wing segment.
 
-            # Determine the connection point
-            if connect_dict.get("location", "tip") == "root":
-                attachment_point = self.get_root_loc()
+        # Determine the connection point
+        if input_dict.get("connect_to", {}).get("location", "tip") == "root":
+            attachment_point = self.get_root_loc()
 
-                # Remove y-offset
-                if self.side == "left":
-                    attachment_point[1] += self.y_offset
-                else:
-                    attachment_point[1] -= self.y_offset
+            # Remove y-offset
+            if self.side == "left":
+                attachment_point[1] += self.y_offset
             else:
-                attachment_point = self.get_tip_loc()
-
-            # Initialize wing segment
-            self._attached_segments[new_segment_name] = WingSegment(new_segment_name, input_dict, side, unit_sys, airfoil_dict, attachment_point)
-
-            # Set whether this segment's parent has a mirror
-            self._attached_segments[new_segment_name].parent_has_mirror = self.has_mirror
-
-            # Return reference to newly created wing segment
-            return self._attached_segments[new_segment_name]
-
-        else: # We need to recurse deeper
-
-            result = False
-            for segment_name, segment in self._attached_segments.items():
-
-                result = segment._attach_wing_segment(new_segment_name, input_dict, side, unit_sys, airfoil_dict)
+                attachment_point[1] -= self.y_offset
+        else:
+            attachment_point = self.get_tip_loc()
 
-                if result is not False:
-                    break
+        # Initialize wing segment
+        self._attached_segments[new_segment_name] = WingSegment(new_segment_name, input_dict, side, unit_sys, airfoil_dict, attachment_point)
 
-            if self.ID == 0 and not result:
-                raise RuntimeError("Could not attach wing segment {0}. Check ID of parent is valid.".format(new_segment_name))
+        # Set whether this segment's parent has a mirror
+        self._attached_segments[new_segment_name].parent_has_mirror = self.has_mirror
 
-            return result
+        # Return reference to newly created wing segment
+        return self._attached_segments[new_segment_name]
 
 
     def _get_attached_wing_segment(self, new_segment_name):
-        # Returns a reference to the specified wing segment.
-        try:
-            # See if it is attached to this wing segment
-            return self._attached_segments[new_segment_name]
-        except KeyError:
-            # Otherwise
-            result = False
-            for key in self._attached_segments:
-                result = self._attached_segments[key]._get_attached_wing_segment(new_segment_name)
-                if result:
-                    break
-
-            return result
+        # Returns a reference to the specified wing segment. Can only be called on the origin segment.
+        return self._segments_by_name.get(new_segment_name, False)
 
 
     def get_root_loc(self):
@@ -940,24 +904,26 @@ class WingSegment:
 
         if self._qc_data_type == "standard":
 
-            # Integrate sweep and dihedral along the span to get the location
-            ds = np.zeros((span_array.shape[0],3))
-            for i, span in enumerate(span_array):
-                for j, discont in enumerate(self._discont):
-
-                    # Skip 0.0
-                    if j == 0:
-                        continue
-                    else:
-                        if span > discont:
-                            ds[i,0] += integ.quad(lambda s : np.tan(self.get_sweep(s)), self._discont[j-1], discont)[0]*self.b
-                            ds[i,1] += integ.quad(lambda s : -np.cos(self.get_dihedral(s)), self._discont[j-1], discont)[0]*self.b
-                            ds[i,2] += integ.quad(lambda s : -np.sin(self.get_dihedral(s)), self._discont[j-1], discont)[0]*self.b
-                        elif span <= discont:
-                            ds[i,0] += integ.quad(lambda s : np.tan(self.get_sweep(s)), self._discont[j-1], span)[0]*self.b
-                            ds[i,1] += integ.quad(lambda s : -np.cos(self.get_dihedral(s)), self._discont[j-1], span)[0]*self.b
-                            ds[i,2] += integ.quad(lambda s : -np.sin(self.get_dihedral(s)), self._discont[j-1], span)[0]*self.b
-                            break
+            # Integrate sweep and dihedral along the span to get the location. The requested span locations
+            # are merged with the discontinuities, and the integrands, being smooth between these points, are
+            # integrated over each sub-interval using a fixed-order Gauss-Legendre rule. The integrals are
+            # then accumulated so that a single evaluation of the sweep and dihedral serves all span locations.
+            span_clipped = np.clip(span_array, 0.0, 1.0)
+            breaks = np.union1d(self._discont, span_clipped)
+            half_width = 0.5*np.diff(breaks)
+            s = (breaks[:-1]+half_width)[:,np.newaxis]+half_width[:,np.newaxis]*_GAUSS_NODES
+            weights = half_width[:,np.newaxis]*_GAUSS_WEIGHTS*self.b
+
+            # Evaluate integrands
+            sweep = self.get_sweep(s.flatten()).reshape(s.shape)
+            dihedral = self.get_dihedral(s.flatten()).reshape(s.shape)
+
+            # Integrate
+            cumulative = np.zeros((breaks.size,3))
+            cumulative[1:,0] = np.cumsum(np.sum(weights*np.tan(sweep), axis=1))
+            cumulative[1:,1] = -np.cumsum(np.sum(weights*np.cos(dihedral), axis=1))
+            cumulative[1:,2] = -np.cumsum(np.sum(weights*np.sin(dihedral), axis=1))
+            ds = cumulative[np.searchsorted(breaks, span_clipped)]
 
             # Apply based on which side
             if self.side == "left":
@@ -986,55 +952,52 @@ class WingSegment:
         return qc_loc
 
 
-    def _get_unswept_axial_vec(self, span):
-        # Returns the axial vector at the given span locations, not taking sweep into account
-        if isinstance(span, float):
-            span_array = np.asarray(span)[np.newaxis]
-        else:
-            span_array = np.asarray(span)
-
-        twist = self.get_twist(span_array)
-        dihedral = self.get_dihedral(span_array)
-        
+    def _get_unswept_vecs(self, twist, dihedral):
+        # Returns the axial, normal, and spanwise vectors, not taking sweep into account, for the given
+        # twist and dihedral. The trig functions are evaluated only once for all three vectors.
         C_twist = np.cos(twist)
         S_twist = np.sin(twist)
         C_dihedral = np.cos(dihedral)
         S_dihedral = np.sin(dihedral)
 
-        return np.asarray([-C_twist, -S_twist*S_dihedral, S_twist*C_dihedral]).T
+        # Axial vector
+        u_a = self._build_unswept_axial_vec(C_twist, S_twist, C_dihedral, S_dihedral)
 
+        # Normal vector
+        u_n = np.empty((C_twist.size,3))
+        u_n[:,0] = -S_twist
+        u_n[:,1] = C_twist*S_dihedral
+        u_n[:,2] = -C_twist*C_dihedral
 
-    def _get_unswept_normal_vec(self, span):
-        # Returns the normal vector at the given span locations
-        if isinstance(span, float):
-            span_array = np.asarray(span)[np.newaxis]
-        else:
-            span_array = np.asarray(span)
+        # Spanwise vector
+        u_s = np.empty((C_twist.size,3))
+        u_s[:,0] = 0.0
+        u_s[:,1] = C_dihedral
+        u_s[:,2] = S_dihedral
+
+        return u_a, u_n, u_s
 
-        twist = self.get_twist(span_array)
-        dihedral = self.get_dihedral(span_array)
-        
-        C_twist = np.cos(twist)
-        S_twist = np.sin(twist)
-        C_dihedral = np.cos(dihedral)
-        S_dihedral = np.sin(dihedral)
 
-        return np.asarray([-S_twist, C_twist*S_dihedral, -C_twist*C_dihedral]).T
+    def _build_unswept_axial_vec(self, C_twist, S_twist, C_dihedral, S_dihedral):
+        # Assembles the axial vectors, not taking sweep into account, from the cosines and sines of twist and dihedral
+        u_a = np.empty((C_twist.size,3))
+        u_a[:,0] = -C_twist
+        u_a[:,1] = -S_twist*S_dihedral
+        u_a[:,2] = S_twist*C_dihedral
+        return u_a
 
 
-    def _get_unswept_span_vec(self, span):
-        # Returns the normal vector at the given span locations
+    def _get_unswept_axial_vec(self, span):
+        # Returns the axial vector at the given span locations, not taking sweep into account
         if isinstance(span, float):
             span_array = np.asarray(span)[np.newaxis]
         else:
             span_array = np.asarray(span)
 
+        twist = self.get_twist(span_array)
         dihedral = self.get_dihedral(span_array)
-
-        C_dihedral = np.cos(dihedral)
-        S_dihedral = np.sin(dihedral)
-
-        return np.asarray([np.zeros(span_array.size), C_dihedral, S_dihedral]).T
+        
+        return self._build_unswept_axial_vec(np.cos(twist), np.sin(twist), np.cos(dihedral), np.sin(dihedral))
 
 
     def _get_ll_loc(self, span):
@@ -1046,43 +1009,66 @@ class WingSegment:
             single = False
             span = np.asarray(span)
 
-        loc = self._get_quarter_chord_loc(span)
-        loc += (self._get_ll_offset(span)*self.get_chord(span))[:,np.newaxis]*self._get_unswept_axial_vec(span)
+        loc = self._ll_loc_from_fields(span, self.get_chord(span), self._get_unswept_axial_vec(span))
         if single:
             loc = loc.item()
         return loc
 
 
+    def _ll_loc_from_fields(self, span, chord, u_a_unswept):
+        # Returns the location of the lifting line at the given span fractions using
+        # chord lengths and unswept axial vectors which have already been evaluated there.
+        loc = self._get_quarter_chord_loc(span)
+        loc += (self._get_ll_offset(span)*chord)[:,np.newaxis]*u_a_unswept
+        return loc
+
+
     def _get_cp_avg_chord_lengths(self):
         # Returns the average local chord length at each control point on the segment.
-        node_chords = self.get_chord(self.node_span_locs)
+        node_chords = self.c_node
         return (node_chords[1:]+node_chords[:-1])/2
 
 
-    def _airfoil_interpolator(self, interp_spans, sample_spans, vals):
-        # Interpolates the airfoil coefficients at the given span locations.
-        # Allows for the coefficients having been evaluated as a function of 
-        # span as well.
-        # Solution found on stackoverflow
-        i = np.arange(interp_spans.size)
-        j = np.searchsorted(sample_spans, interp_spans) - 1
-        j = np.where(j<0, 0, j) # Not allowed to go outside the array
-        d = (interp_spans-sample_spans[j])/(sample_spans[j+1]-sample_spans[j])
-        return_val = (1-d)*vals[i,j]+d*vals[i,j+1]
+    def _airfoil_interpolator(self, coefs):
+        # Interpolates the airfoil coefficients at each control point. coefs[i,j]
+        # holds the coefficient of the j-th airfoil at the i-th control point and
+        # need only be defined for the two airfoils bounding each control point.
+        return_val = np.zeros(self.N)
+        for j, cur_slice in enumerate(self._airfoil_slices):
+            return_val[cur_slice] = self._airfoil_interp_1md[cur_slice]*coefs[cur_slice,j]+self._airfoil_interp_d[cur_slice]*coefs[cur_slice,j+1]
         return return_val
 
 
+    def _specialize_airfoil_getters(self):
+        # Binds the current flap deflections and chord fractions to the coefficient getters of
+        # each airfoil. These only change when the control state changes, so the getters called
+        # by the solver need only be passed the angle of attack, Reynolds number, and Mach number.
+
+        # Get flap inputs for each airfoil
+        if self._num_airfoils == 1:
+            flap_inputs = [{
+                "trailing_flap_deflection" : self._delta_flap,
+                "trailing_flap_fraction" : self._cp_c_f
+            }]
+        else:
+            flap_inputs = [{
+                "trailing_flap_deflection" : self._delta_flap[cur_slice],
+                "trailing_flap_fraction" : self._cp_c_f[cur_slice]
+            } for cur_slice in self._airfoil_eval_slices]
+
+        # Create getters
+        self._airfoil_getters = {}
+        for coef_func in ["get_CLa", "get_aL0", "get_CLRe", "get_CLM", "get_CL", "get_CD", "get_Cm"]:
+            self._airfoil_getters[coef_func] = [functools.partial(getattr(airfoil, coef_func), **inputs) for airfoil, inputs in zip(self._airfoils, flap_inputs)]
+
+
     def _get_control_point_coef(self, alpha, Rey, Mach, coef_func):
         # Determines the value of the desired coefficient at each control point
 
         # Only one airfoil
         if self._num_airfoils == 1:
             try:
-                return getattr(self._airfoils[0], coef_func)(alpha=alpha,
-                                                             Rey=Rey,
-                                                             Mach=Mach,
-                                                             trailing_flap_deflection=self._delta_flap,
-                                                             trailing_flap_fraction=self._cp_c_f)
+                return self._airfoil_getters[coef_func][0](alpha=alpha, Rey=Rey, Mach=Mach)
 
             except DatabaseBoundsError as e:
 
@@ -1105,22 +1091,13 @@ class WingSegment:
 
             try:
 
-                # Create array of coefficients
+                # Create array of coefficients; each airfoil is evaluated once at all the control points it influences
                 coefs = np.zeros((self.N, self._num_airfoils))
-                for j, cur_slice in enumerate(self._airfoil_slices):
-                    coefs[cur_slice,j] = getattr(self._airfoils[j], coef_func)(alpha=alpha[cur_slice],
-                                                                               Rey=Rey[cur_slice],
-                                                                               Mach=Mach[cur_slice],
-                                                                               trailing_flap_deflection=self._delta_flap[cur_slice],
-                                                                               trailing_flap_fraction=self._cp_c_f[cur_slice])
-                    coefs[cur_slice,j+1] = getattr(self._airfoils[j+1], coef_func)(alpha=alpha[cur_slice],
-                                                                                   Rey=Rey[cur_slice],
-                                                                                   Mach=Mach[cur_slice],
-                                                                                   trailing_flap_deflection=self._delta_flap[cur_slice],
-                                                                                   trailing_flap_fraction=self._cp_c_f[cur_slice])
+                for j, (cur_slice, getter) in enumerate(zip(self._airfoil_eval_slices, self._airfoil_getters[coef_func])):
+                    coefs[cur_slice,j] = getter(alpha=alpha[cur_slice], Rey=Rey[cur_slice], Mach=Mach[cur_slice])
 
                 # Interpolate
-                return_coefs = self._airfoil_interpolator(self.cp_span_locs, self._airfoil_spans, coefs)
+                return_coefs = self._airfoil_interpolator(coefs)
                 return return_coefs
             except DatabaseBoundsError as e:
                 # TODO Make useful error message here
@@ -1299,13 +1276,19 @@ class WingSegment:
         chords = self.get_chord(spans)
         axial_vecs = self._get_unswept_axial_vec(spans)
 
-        points = np.zeros((self.N*2+1,3))
+        chord_vecs = axial_vecs*chords[:,np.newaxis]
+
+        points = np.empty((self.N*2+1,3))
 
         # Leading edge
-        points[:self.N,:] = qc_points - 0.25*(axial_vecs*chords[:,np.newaxis])
+        le_points = points[:self.N,:]
+        np.multiply(chord_vecs, -0.25, out=le_points)
+        le_points += qc_points
 
         # Trailing edge
-        points[-2:self.N-1:-1,:] = qc_points + 0.75*(axial_vecs*chords[:,np.newaxis])
+        te_points = points[-2:self.N-1:-1,:]
+        np.multiply(chord_vecs, 0.75, out=te_points)
+        te_points += qc_points
 
         # Complete the circle
         points[-1,:] = points[0,:]
@@ -1315,9 +1298,10 @@ class WingSegment:
             in_cntrl_surf = (spans >= self._cntrl_root_span) & (spans <= self._cntrl_tip_span)
             num_cntrl_points = np.sum(in_cntrl_surf)+2
             cntrl_points = np.zeros((num_cntrl_points,3))
-            cntrl_points[1:num_cntrl_points-1,:] = (qc_points + (0.75-self.get_c_f(spans))[:,np.newaxis]*(axial_vecs*chords[:,np.newaxis]))[in_cntrl_surf]
-            cntrl_points[0,:] = (qc_points + 0.75*(axial_vecs*chords[:,np.newaxis]))[in_cntrl_surf][0]
-            cntrl_points[-1,:] = (qc_points + 0.75*(axial_vecs*chords[:,np.newaxis]))[in_cntrl_surf][-1]
+            cntrl_points[1:num_cntrl_points-1,:] = qc_points[in_cntrl_surf] + (0.75-self.get_c_f(spans[in_cntrl_surf]))[:,np.newaxis]*chord_vecs[in_cntrl_surf]
+            cntrl_te_points = te_points[in_cntrl_surf]
+            cntrl_points[0,:] = cntrl_te_points[0]
+            cntrl_points[-1,:] = cntrl_te_points[-1]
         else:
             cntrl_points = None
 
@@ -1343,35 +1327,36 @@ class WingSegment:
         if not self._has_control_surface:
             return # Don't even bother...
 
-        # Determine flap deflection
-        self._delta_flap = np.zeros(self.N)
-        for key in self._control_mixing:
+        # Determine the signed gain of each control
+        signs = np.array([1.0 if self.side == "right" or control_symmetry[key] else -1.0 for key in self._control_keys])
+        gains = signs*self._control_mixing_gains
 
-            # Get input
+        # Get inputs
+        cntrl_spans = self.cp_span_locs[self._cp_cntrl_slice]
+        uniform_deflections = np.zeros(len(self._control_keys))
+        variable_deflection = np.zeros(cntrl_spans.shape[0])
+        for i, key in enumerate(self._control_keys):
             deflection = import_value(key, control_state, self._unit_sys, 0.0)
 
             # Arrange distribution
             if isinstance(deflection, np.ndarray): # Variable deflection
                 if deflection[0,0] != self._cntrl_root_span or deflection[-1,0] != self._cntrl_tip_span:
                     raise IOError("Endpoints of flap deflection distribution must match specified root and tip span locations.")
-                new_deflection = np.zeros(self.N)
-                new_deflection[self._cp_in_cntrl_surf] = np.interp(self.cp_span_locs[self._cp_in_cntrl_surf], deflection[:,0], deflection[:,1])
-                deflection = new_deflection
+                variable_deflection += gains[i]*np.interp(cntrl_spans, deflection[:,0], deflection[:,1])
             elif callable(deflection):
-                deflection = deflection(self.cp_span_locs)
-
-            # Check for distribution
-            if self.side == "right" or control_symmetry[key]:
-                self._delta_flap += deflection*self._control_mixing.get(key, 0.0)*self._cp_in_cntrl_surf
+                variable_deflection += gains[i]*deflection(cntrl_spans)
             else:
-                self._delta_flap -= deflection*self._control_mixing.get(key, 0.0)*self._cp_in_cntrl_surf
+                uniform_deflections[i] = deflection
 
-        # Convert to radians
-        self._delta_flap = np.radians(self._delta_flap)
+        # Determine flap deflection
+        self._delta_flap = np.zeros(self.N)
+        self._delta_flap[self._cp_cntrl_slice] = np.radians(variable_deflection+gains.dot(uniform_deflections))
 
         # Apply saturation
-        self._delta_flap = np.where(self._delta_flap>self._saturation_angle, self._saturation_angle, self._delta_flap)
-        self._delta_flap = np.where(self._delta_flap<-self._saturation_angle, -self._saturation_angle, self._delta_flap)
+        np.clip(self._delta_flap, -self._saturation_angle, self._saturation_angle, out=self._delta_flap)
+
+        # Update airfoil coefficient getters
+        self._specialize_airfoil_getters()
 
 
     def get_stl_vectors(self, **kwargs):
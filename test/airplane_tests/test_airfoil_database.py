@@ -0,0 +1,33 @@
+# Tests the creation of the airplane's airfoil database
+
+import machupX as MX
+import numpy as np
+import json
+from airfoil_db import Airfoil
+
+input_file = "test/input_for_testing.json"
+
+def test_prebuilt_airfoils_used_as_is():
+    # Tests that airfoil objects passed in through the airplane dictionary are used without being rebuilt
+
+    # Load input
+    input_dict, airplane_name, airplane_dict, state, control_state = MX.helpers.parse_input(input_file)
+    with open(airplane_dict["airfoils"], 'r') as airfoil_file_handle:
+        airfoil_dict = json.load(airfoil_file_handle)
+    airfoils = {key : Airfoil(key, value) for key, value in airfoil_dict.items()}
+    airplane_dict["airfoils"] = airfoils
+
+    # Create scene
+    scene = MX.Scene(input_dict)
+    scene.add_aircraft(airplane_name, airplane_dict, state=state, control_state=control_state)
+
+    # Check the database holds the same objects
+    airfoil_database = scene._airplanes[airplane_name]._airfoil_database
+    assert list(airfoil_database.keys()) == list(airfoils.keys())
+    for key, airfoil in airfoils.items():
+        assert airfoil_database[key] is airfoil
+
+    # Check the wing segments reference these objects
+    for segment in scene._airplanes[airplane_name].wing_segments.values():
+        for airfoil in segment._airfoils:
+            assert any(airfoil is shared_airfoil for shared_airfoil in airfoils.values())
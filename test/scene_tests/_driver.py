@@ -0,0 +1,27 @@
+# Runs a batch of state-only solve_forces cases on a single scene
+
+import machupX as MX
+import copy
+
+
+def run_all_cases(input_dict, aircraft_name, cases):
+    # Builds the scene described by input_dict once, then solves each case for the named aircraft
+    # in turn. Each case is a sequence beginning with (name, solver type, control state, state,
+    # non_dimensional) and may only alter the state of the aircraft. Returns the force and moment
+    # totals of each case, keyed by case name.
+
+    scene = MX.Scene(input_dict)
+
+    results = {}
+    for name, solver, ctrl, state, nondim, *_ in cases:
+
+        # Set the solver type, state, and control state
+        scene._solver_type = solver
+        scene.set_aircraft_state(state=copy.deepcopy(state), aircraft=aircraft_name)
+        scene.set_aircraft_control_state(control_state=copy.deepcopy(ctrl), aircraft=aircraft_name)
+
+        # Solve
+        FM = scene.solve_forces(non_dimensional=nondim)
+        results[name] = FM[aircraft_name]["total"]
+
+    return results
@@ -2,283 +2,142 @@
 
 import machupX as MX
 import numpy as np
+import pytest
+from airfoil_db import Airfoil
 import json
 import subprocess as sp
 
-input_file = "test/input_for_testing.json"
-
-
-def test_linear_solver():
-    # Tests the NLL algorithm is correctly solved
-
-    # Alter input
-    with open(input_file, 'r') as input_file_handle:
-        input_dict = json.load(input_file_handle)
-
-    input_dict["solver"]["type"] = "linear"
-
-    input_dict["scene"]["aircraft"]["test_plane"]["control_state"] = {
-        "elevator" : 0.0,
-        "rudder" : 0.0,
-        "aileron" : 0.0
-    }
-
-    input_dict["scene"]["aircraft"]["test_plane"]["state"] = {
-        "position" : [0, 0, 1000],
-        "angular_rates" : [0.0, 0.0, 0.0],
-        "velocity" : 100,
-        "alpha" : 2.0,
-        "beta" : 0.0
-    }
-
-    # Create scene
-    scene = MX.Scene(input_dict)
-    FM = scene.solve_forces()
-    print(json.dumps(FM["test_plane"]["total"], indent=4))
-    assert abs(FM["test_plane"]["total"]["FL"]-20.961790953642968)<1e-10
-    assert abs(FM["test_plane"]["total"]["FD"]-1.3934413451737937)<1e-10
-    assert abs(FM["test_plane"]["total"]["FS"])<1e-10
-    assert abs(FM["test_plane"]["total"]["Fx"]+0.6610365440906614)<1e-10
-    assert abs(FM["test_plane"]["total"]["Fy"])<1e-10
-    assert abs(FM["test_plane"]["total"]["Fz"]+20.997651998593668)<1e-10
-    assert abs(FM["test_plane"]["total"]["Mx"])<1e-10
-    assert abs(FM["test_plane"]["total"]["My"]+12.877269524986069)<1e-10
-    assert abs(FM["test_plane"]["total"]["Mz"])<1e-10
-
-
-def test_linear_solver_with_rotation():
-    # Tests the NLL algorithm is correctly solved
-
-    # Alter input
-    with open(input_file, 'r') as input_file_handle:
-        input_dict = json.load(input_file_handle)
-
-    input_dict["solver"]["type"] = "linear"
-
-    input_dict["scene"]["aircraft"]["test_plane"]["control_state"] = {
-        "elevator" : 0.0,
-        "rudder" : 0.0,
-        "aileron" : 0.0
-    }
-
-    input_dict["scene"]["aircraft"]["test_plane"]["state"] = {
-        "position" : [0, 0, 1000],
-        "angular_rates" : [0.2, 0.2, 0.2],
-        "velocity" : 100,
-        "alpha" : 2.0,
-        "beta" : 0.0
-    }
-
-    # Create scene
-    scene = MX.Scene(input_dict)
-    FM = scene.solve_forces()
-    print(json.dumps(FM["test_plane"]["total"], indent=4))
-    assert abs(FM["test_plane"]["total"]["FL"]-22.199329484957747)<1e-10
-    assert abs(FM["test_plane"]["total"]["FD"]-1.4182873883741445)<1e-10
-    assert abs(FM["test_plane"]["total"]["FS"]-0.4463758217770067)<1e-10
-    assert abs(FM["test_plane"]["total"]["Fx"]+0.6426779798599743)<1e-10
-    assert abs(FM["test_plane"]["total"]["Fy"]-0.4463758217770067)<1e-10
-    assert abs(FM["test_plane"]["total"]["Fz"]+22.235303769275085)<1e-10
-    assert abs(FM["test_plane"]["total"]["Mx"]+3.5422710730907068)<1e-10
-    assert abs(FM["test_plane"]["total"]["My"]+16.3420085486301)<1e-10
-    assert abs(FM["test_plane"]["total"]["Mz"]+1.4273289149763269)<1e-10
-
-
-def test_nonlinear_solver():
-    # Tests the NLL algorithm is correctly solved
-
-    # Alter input
-    with open(input_file, 'r') as input_file_handle:
-        input_dict = json.load(input_file_handle)
-
-    input_dict["solver"]["type"] = "nonlinear"
-
-    input_dict["scene"]["aircraft"]["test_plane"]["control_state"] = {
-        "elevator" : 0.0,
-        "rudder" : 0.0,
-        "aileron" : 0.0
-    }
-
-    input_dict["scene"]["aircraft"]["test_plane"]["state"] = {
-        "position" : [0, 0, 1000],
-        "angular_rates" : [0.0, 0.0, 0.0],
-        "velocity" : 100,
-        "alpha" : 2.0,
-        "beta" : 0.0
-    }
-
-    # Create scene
-    scene = MX.Scene(input_dict)
-    FM = scene.solve_forces()
-    print(json.dumps(FM["test_plane"]["total"], indent=4))
-    assert abs(FM["test_plane"]["total"]["FL"]-20.959074770349314)<1e-10
-    assert abs(FM["test_plane"]["total"]["FD"]-1.3934114313254868)<1e-10
-    assert abs(FM["test_plane"]["total"]["FS"])<1e-10
-    assert abs(FM["test_plane"]["total"]["Fx"]+0.661101441894963)<1e-10
-    assert abs(FM["test_plane"]["total"]["Fy"])<1e-10
-    assert abs(FM["test_plane"]["total"]["Fz"]+20.994936425947238)<1e-10
-    assert abs(FM["test_plane"]["total"]["Mx"])<1e-10
-    assert abs(FM["test_plane"]["total"]["My"]+12.873864820066961)<1e-10
-    assert abs(FM["test_plane"]["total"]["Mz"])<1e-10
-
-
-def test_sideslip():
-    # Tests the algorithm is correctly solved when there is sideslip
-
-    # Alter input
-    with open(input_file, 'r') as input_file_handle:
-        input_dict = json.load(input_file_handle)
-
-    input_dict["solver"]["type"] = "linear"
-
-    input_dict["scene"]["aircraft"]["test_plane"]["control_state"] = {
-        "elevator" : 0.0,
-        "rudder" : 0.0,
-        "aileron" : 0.0
-    }
-
-    input_dict["scene"]["aircraft"]["test_plane"]["state"] = {
-        "position" : [0, 0, 1000],
-        "angular_rates" : [0.0, 0.0, 0.0],
-        "velocity" : 100,
-        "alpha" : 2.0,
-        "beta" : 3.0
-    }
+import _driver
 
-    # Create scene
-    scene = MX.Scene(input_dict)
-    FM = scene.solve_forces()
-    print(json.dumps(FM["test_plane"]["total"], indent=4))
-    assert abs(FM["test_plane"]["total"]["FL"]-20.974530024918774)<1e-10
-    assert abs(FM["test_plane"]["total"]["FD"]-1.5652160687735406)<1e-10
-    assert abs(FM["test_plane"]["total"]["FS"]+4.058609066006053)<1e-10
-    assert abs(FM["test_plane"]["total"]["Fx"]+0.6178364811613699)<1e-10
-    assert abs(FM["test_plane"]["total"]["Fy"]+4.134963963022404)<1e-10
-    assert abs(FM["test_plane"]["total"]["Fz"]+21.00889025545816)<1e-10
-    assert abs(FM["test_plane"]["total"]["Mx"]+3.2179510813875187)<1e-10
-    assert abs(FM["test_plane"]["total"]["My"]+13.079817929574196)<1e-10
-    assert abs(FM["test_plane"]["total"]["Mz"]-12.29316240278045)<1e-10
-
-
-def test_angular_rotation():
-    # Tests the algorithm is correctly solved when there is angular rotation
-
-    # Alter input
-    with open(input_file, 'r') as input_file_handle:
-        input_dict = json.load(input_file_handle)
-
-    input_dict["solver"]["type"] = "nonlinear"
-
-    input_dict["scene"]["aircraft"]["test_plane"]["control_state"] = {
-        "elevator" : 0.0,
-        "rudder" : 0.0,
-        "aileron" : 0.0
-    }
-
-    input_dict["scene"]["aircraft"]["test_plane"]["state"] = {
-        "position" : [0, 0, 1000],
-        "angular_rates" : [0.0, 0.1, 0.1],
-        "velocity" : 100,
-        "alpha" : 2.0,
-        "beta" : 3.0
-    }
-
-    # Create scene
-    scene = MX.Scene(input_dict)
-    FM = scene.solve_forces()
-    print(json.dumps(FM["test_plane"]["total"], indent=4))
-    assert abs(FM["test_plane"]["total"]["FL"]-21.577973332611467)<1e-10
-    assert abs(FM["test_plane"]["total"]["FD"]-1.5715676937388965)<1e-10
-    assert abs(FM["test_plane"]["total"]["FS"]+3.8259279872299494)<1e-10
-    assert abs(FM["test_plane"]["total"]["Fx"]+0.6152858382833962)<1e-10
-    assert abs(FM["test_plane"]["total"]["Fy"]+3.9029341839442906)<1e-10
-    assert abs(FM["test_plane"]["total"]["Fz"]+21.61261231816672)<1e-10
-    assert abs(FM["test_plane"]["total"]["Mx"]+2.9268795847665534)<1e-10
-    assert abs(FM["test_plane"]["total"]["My"]+14.780806933014897)<1e-10
-    assert abs(FM["test_plane"]["total"]["Mz"]-11.5917753218481)<1e-10
-
-
-def test_flap_deflection():
-    # Tests the algorithm is correctly solved when there is flap deflection
-
-    # Alter input
-    with open(input_file, 'r') as input_file_handle:
-        input_dict = json.load(input_file_handle)
-
-    input_dict["solver"]["type"] = "linear"
-
-    input_dict["scene"]["aircraft"]["test_plane"]["control_state"] = {
-        "elevator" : -2.0,
-        "rudder" : 0.0,
-        "aileron" : 3.0
-    }
-
-    input_dict["scene"]["aircraft"]["test_plane"]["state"] = {
-        "position" : [0, 0, 1000],
-        "angular_rates" : [0.0, 0.0, 0.0],
-        "velocity" : 100,
-        "alpha" : 2.0,
-        "beta" : 0.0
-    }
-
-    # Create scene
-    scene = MX.Scene(input_dict)
-    FM = scene.solve_forces(non_dimensional=False)
-    print(json.dumps(FM["test_plane"]["total"], indent=4))
-    assert abs(FM["test_plane"]["total"]["FL"]-15.381452407184405)<1e-10
-    assert abs(FM["test_plane"]["total"]["FD"]-2.1713087073211823)<1e-10
-    assert abs(FM["test_plane"]["total"]["FS"]-0.640734030322335)<1e-10
-    assert abs(FM["test_plane"]["total"]["Fx"]+1.6331810571592724)<1e-10
-    assert abs(FM["test_plane"]["total"]["Fy"]-0.640734030322335)<1e-10
-    assert abs(FM["test_plane"]["total"]["Fz"]+15.447860023042152)<1e-10
-    assert abs(FM["test_plane"]["total"]["Mx"]+9.613302174142484)<1e-10
-    assert abs(FM["test_plane"]["total"]["My"]-3.615122963872464)<1e-10
-    assert abs(FM["test_plane"]["total"]["Mz"]+2.2740074284582805)<1e-10
-
-
-def test_coefficients():
-    # Tests the NLL algorithm correctly returns nondimensional coefficients
-
-    # Alter input
-    with open(input_file, 'r') as input_file_handle:
-        input_dict = json.load(input_file_handle)
-
-    input_dict["solver"]["type"] = "linear"
-
-    input_dict["scene"]["aircraft"]["test_plane"]["control_state"] = {
-        "elevator" : 0.0,
-        "rudder" : 0.0,
-        "aileron" : 0.0
-    }
-
-    input_dict["scene"]["aircraft"]["test_plane"]["state"] = {
-        "position" : [0, 0, 1000],
-        "angular_rates" : [0.0, 0.0, 0.0],
-        "velocity" : 100,
-        "alpha" : 2.0,
-        "beta" : 0.0
-    }
+input_file = "test/input_for_testing.json"
 
-    # Create scene
-    scene = MX.Scene(input_dict)
-    FM = scene.solve_forces(non_dimensional=True)
-    print(json.dumps(FM["test_plane"]["total"], indent=4))
-    assert abs(FM["test_plane"]["total"]["CL"]-0.22047491174230177)<1e-10
-    assert abs(FM["test_plane"]["total"]["CD"]-0.014656135932024195)<1e-10
-    assert abs(FM["test_plane"]["total"]["CS"])<1e-10
-    assert abs(FM["test_plane"]["total"]["Cx"]+0.006952744354675291)<1e-10
-    assert abs(FM["test_plane"]["total"]["Cy"])<1e-10
-    assert abs(FM["test_plane"]["total"]["Cz"]+0.2208520961507322)<1e-10
-    assert abs(FM["test_plane"]["total"]["Cl"])<1e-10
-    assert abs(FM["test_plane"]["total"]["Cm"]+0.13544238029478695)<1e-10
-    assert abs(FM["test_plane"]["total"]["Cn"])<1e-10
-
-
-def test_swept_wing():
+# The input files are static, so read and parse them only once; json.loads of the cached text gives a fresh copy.
+# Only immutable text is kept at module level. When run with pytest-xdist, use --dist loadgroup so the
+# test_solve cases stay on one worker and all_results is only computed once.
+with open(input_file, 'r') as input_file_handle:
+    _BASE_INPUT_TEXT = input_file_handle.read()
+_PARSED_INPUT_TEXT = json.dumps(MX.helpers.parse_input(input_file))
+
+
+def _parsed_input():
+    # Returns a fresh copy of the parsed input (scene dict, aircraft name, aircraft dict, state, control state)
+    return json.loads(_PARSED_INPUT_TEXT)
+
+
+# Force and moment totals checked by each test
+KEYS = ("FL", "FD", "FS", "Fx", "Fy", "Fz", "Mx", "My", "Mz")
+COEF_KEYS = ("CL", "CD", "CS", "Cx", "Cy", "Cz", "Cl", "Cm", "Cn")
+
+# Expected totals of each test, in the order of KEYS (COEF_KEYS for the coefficients case)
+EXPECTED = {
+    "linear" : np.array([20.961790953642968, 1.3934413451737937, 0.0,
+                         -0.6610365440906614, 0.0, -20.997651998593668,
+                         0.0, -12.877269524986069, 0.0], dtype=np.float64),
+    "linear_with_rotation" : np.array([22.199329484957747, 1.4182873883741445, 0.4463758217770067,
+                                       -0.6426779798599743, 0.4463758217770067, -22.235303769275085,
+                                       -3.5422710730907068, -16.3420085486301, -1.4273289149763269], dtype=np.float64),
+    "nonlinear" : np.array([20.959074770349314, 1.3934114313254868, 0.0,
+                            -0.661101441894963, 0.0, -20.994936425947238,
+                            0.0, -12.873864820066961, 0.0], dtype=np.float64),
+    "sideslip" : np.array([20.974530024918774, 1.5652160687735406, -4.058609066006053,
+                           -0.6178364811613699, -4.134963963022404, -21.00889025545816,
+                           -3.2179510813875187, -13.079817929574196, 12.29316240278045], dtype=np.float64),
+    "angular_rotation" : np.array([21.577973332611467, 1.5715676937388965, -3.8259279872299494,
+                                   -0.6152858382833962, -3.9029341839442906, -21.61261231816672,
+                                   -2.9268795847665534, -14.780806933014897, 11.5917753218481], dtype=np.float64),
+    "flap_deflection" : np.array([15.381452407184405, 2.1713087073211823, 0.640734030322335,
+                                  -1.6331810571592724, 0.640734030322335, -15.447860023042152,
+                                  -9.613302174142484, 3.615122963872464, -2.2740074284582805], dtype=np.float64),
+    "coefficients" : np.array([0.22047491174230177, 0.014656135932024195, 0.0,
+                               -0.006952744354675291, 0.0, -0.2208520961507322,
+                               0.0, -0.13544238029478695, 0.0], dtype=np.float64),
+    "swept_wing" : np.array([19.783804843985347, 1.3995975291276221, 0.0,
+                             -0.7083001002131478, 0.0, -19.820598333967528,
+                             0.0, -30.13434354434114, 0.0], dtype=np.float64),
+    "swept_wing_with_controls" : np.array([32.445031339087635, 4.123299947318139, -4.4145932035790505,
+                                           -2.9884728801670395, -4.4145932035790505, -32.569167795546115,
+                                           -17.912175298121873, -76.51336732249929, 14.040324769001394], dtype=np.float64),
+    "tapered_wing" : np.array([17.722533099036767, 1.184375545596456, 0.0,
+                               -0.565146570565037, 0.0, -17.753071121167718,
+                               0.0, -13.573362229826092, 0.0], dtype=np.float64),
+    "step_change_in_twist_wing" : np.array([28.36516174602864, 2.996305717918925, 0.0,
+                                            -2.004550580611607, 0.0, -28.452452017416174,
+                                            0.0, -18.71714165086305, 0.0], dtype=np.float64),
+    "swept_wing_with_aerodynamic_twist" : np.array([-1.921431422738798, 0.6730156268500228, 0.0,
+                                                    -0.622487790173485, 0.0, 1.9383904914534897,
+                                                    0.0, 0.41401938251627074, 0.0], dtype=np.float64),
+}
+
+# State-only variations of the test input: (name, solver type, control state, state, non_dimensional, keys)
+CASES = [
+    ("linear", "linear",
+        {"elevator" : 0.0, "rudder" : 0.0, "aileron" : 0.0},
+        {"position" : [0, 0, 1000], "angular_rates" : [0.0, 0.0, 0.0], "velocity" : 100, "alpha" : 2.0, "beta" : 0.0},
+        True,
+        KEYS),
+    ("linear_with_rotation", "linear",
+        {"elevator" : 0.0, "rudder" : 0.0, "aileron" : 0.0},
+        {"position" : [0, 0, 1000], "angular_rates" : [0.2, 0.2, 0.2], "velocity" : 100, "alpha" : 2.0, "beta" : 0.0},
+        True,
+        KEYS),
+    ("nonlinear", "nonlinear",
+        {"elevator" : 0.0, "rudder" : 0.0, "aileron" : 0.0},
+        {"position" : [0, 0, 1000], "angular_rates" : [0.0, 0.0, 0.0], "velocity" : 100, "alpha" : 2.0, "beta" : 0.0},
+        True,
+        KEYS),
+    ("sideslip", "linear",
+        {"elevator" : 0.0, "rudder" : 0.0, "aileron" : 0.0},
+        {"position" : [0, 0, 1000], "angular_rates" : [0.0, 0.0, 0.0], "velocity" : 100, "alpha" : 2.0, "beta" : 3.0},
+        True,
+        KEYS),
+    ("angular_rotation", "nonlinear",
+        {"elevator" : 0.0, "rudder" : 0.0, "aileron" : 0.0},
+        {"position" : [0, 0, 1000], "angular_rates" : [0.0, 0.1, 0.1], "velocity" : 100, "alpha" : 2.0, "beta" : 3.0},
+        True,
+        KEYS),
+    ("flap_deflection", "linear",
+        {"elevator" : -2.0, "rudder" : 0.0, "aileron" : 3.0},
+        {"position" : [0, 0, 1000], "angular_rates" : [0.0, 0.0, 0.0], "velocity" : 100, "alpha" : 2.0, "beta" : 0.0},
+        False,
+        KEYS),
+    ("coefficients", "linear",
+        {"elevator" : 0.0, "rudder" : 0.0, "aileron" : 0.0},
+        {"position" : [0, 0, 1000], "angular_rates" : [0.0, 0.0, 0.0], "velocity" : 100, "alpha" : 2.0, "beta" : 0.0},
+        True,
+        COEF_KEYS),
+]
+
+
+@pytest.fixture(scope="module")
+def all_results():
+    # Solves every case in CASES in one pass over a single scene, as they alter only the state of the test aircraft
+    return _driver.run_all_cases(json.loads(_BASE_INPUT_TEXT), "test_plane", CASES)
+
+
+@pytest.mark.xdist_group("solve_forces_cases")
+@pytest.mark.parametrize("name,keys", [(case[0], case[5]) for case in CASES], ids=[case[0] for case in CASES])
+def test_solve(all_results, name, keys):
+    # Tests the NLL algorithm is correctly solved for each state of the test aircraft
+
+    FM = all_results[name]
+    actual = np.array([FM[key] for key in keys])
+    np.testing.assert_allclose(actual, EXPECTED[name], rtol=0.0, atol=1e-10)
+
+
+@pytest.fixture(scope="module")
+def shared_airfoils():
+    # Builds the test airfoils once so the geometry tests don't each rebuild them
+    with open("test/airfoils_for_testing.json", 'r') as airfoil_file_handle:
+        airfoil_dict = json.load(airfoil_file_handle)
+    return {key : Airfoil(key, value) for key, value in airfoil_dict.items()}
+
+
+def test_swept_wing(shared_airfoils):
     # Tests the NLL algorithm correctly calculates a swept wing
 
     # Load input
-    input_dict, aircraft_name, aircraft_dict, state, control_state = MX.helpers.parse_input(input_file)
+    input_dict, aircraft_name, aircraft_dict, state, control_state = _parsed_input()
+    aircraft_dict["airfoils"] = shared_airfoils
 
     # Alter input
     input_dict["solver"]["type"] = "nonlinear"
@@ -289,23 +148,16 @@ def test_swept_wing():
     scene = MX.Scene(input_dict)
     scene.add_aircraft(aircraft_name, aircraft_dict, state=state, control_state=control_state)
     FM = scene.solve_forces(non_dimensional=True)
-    print(json.dumps(FM["test_plane"]["total"], indent=4))
-    assert abs(FM["test_plane"]["total"]["FL"]-19.783804843985347)<1e-10
-    assert abs(FM["test_plane"]["total"]["FD"]-1.3995975291276221)<1e-10
-    assert abs(FM["test_plane"]["total"]["FS"])<1e-10
-    assert abs(FM["test_plane"]["total"]["Fx"]+0.7083001002131478)<1e-10
-    assert abs(FM["test_plane"]["total"]["Fy"])<1e-10
-    assert abs(FM["test_plane"]["total"]["Fz"]+19.820598333967528)<1e-10
-    assert abs(FM["test_plane"]["total"]["Mx"])<1e-10
-    assert abs(FM["test_plane"]["total"]["My"]+30.13434354434114)<1e-10
-    assert abs(FM["test_plane"]["total"]["Mz"])<1e-10
-
-
-def test_swept_wing_with_controls():
+    actual = np.array([FM["test_plane"]["total"][key] for key in KEYS])
+    np.testing.assert_allclose(actual, EXPECTED["swept_wing"], rtol=0.0, atol=1e-10)
+
+
+def test_swept_wing_with_controls(shared_airfoils):
     # Tests the NLL algorithm correctly calculates a swept wing
 
     # Load input
-    input_dict, aircraft_name, aircraft_dict, state, control_state = MX.helpers.parse_input(input_file)
+    input_dict, aircraft_name, aircraft_dict, state, control_state = _parsed_input()
+    aircraft_dict["airfoils"] = shared_airfoils
 
     # Alter input
     input_dict["solver"]["type"] = "nonlinear"
@@ -323,23 +175,16 @@ def test_swept_wing_with_controls():
     scene = MX.Scene(input_dict)
     scene.add_aircraft(aircraft_name, aircraft_dict, state=state, control_state=control_state)
     FM = scene.solve_forces(non_dimensional=True)
-    print(json.dumps(FM["test_plane"]["total"], indent=4))
-    assert abs(FM["test_plane"]["total"]["FL"]-32.445031339087635)<1e-10
-    assert abs(FM["test_plane"]["total"]["FD"]-4.123299947318139)<1e-10
-    assert abs(FM["test_plane"]["total"]["FS"]+4.4145932035790505)<1e-10
-    assert abs(FM["test_plane"]["total"]["Fx"]+2.9884728801670395)<1e-10
-    assert abs(FM["test_plane"]["total"]["Fy"]+4.4145932035790505)<1e-10
-    assert abs(FM["test_plane"]["total"]["Fz"]+32.569167795546115)<1e-10
-    assert abs(FM["test_plane"]["total"]["Mx"]+17.912175298121873)<1e-10
-    assert abs(FM["test_plane"]["total"]["My"]+76.51336732249929)<1e-10
-    assert abs(FM["test_plane"]["total"]["Mz"]-14.040324769001394)<1e-10
-
-
-def test_tapered_wing():
+    actual = np.array([FM["test_plane"]["total"][key] for key in KEYS])
+    np.testing.assert_allclose(actual, EXPECTED["swept_wing_with_controls"], rtol=0.0, atol=1e-10)
+
+
+def test_tapered_wing(shared_airfoils):
     # Tests the NLL algorithm correctly calculates a swept wing
 
     # Load input
-    input_dict, aircraft_name, aircraft_dict, state, control_state = MX.helpers.parse_input(input_file)
+    input_dict, aircraft_name, aircraft_dict, state, control_state = _parsed_input()
+    aircraft_dict["airfoils"] = shared_airfoils
 
     # Alter input
     input_dict["solver"]["type"] = "nonlinear"
@@ -351,23 +196,17 @@ def test_tapered_wing():
     scene = MX.Scene(input_dict)
     scene.add_aircraft(aircraft_name, aircraft_dict, state=state, control_state=control_state)
     FM = scene.solve_forces(non_dimensional=True)
-    print(json.dumps(FM["test_plane"]["total"], indent=4))
-    assert abs(FM["test_plane"]["total"]["FL"]-17.722533099036767)<1e-10
-    assert abs(FM["test_plane"]["total"]["FD"]-1.184375545596456)<1e-10
-    assert abs(FM["test_plane"]["total"]["FS"])<1e-10
-    assert abs(FM["test_plane"]["total"]["Fx"]+0.565146570565037)<1e-10
-    assert abs(FM["test_plane"]["total"]["Fy"])<1e-10
-    assert abs(FM["test_plane"]["total"]["Fz"]+17.753071121167718)<1e-10
-    assert abs(FM["test_plane"]["total"]["Mx"])<1e-10
-    assert abs(FM["test_plane"]["total"]["My"]+13.573362229826092)<1e-10
-    assert abs(FM["test_plane"]["total"]["Mz"])<1e-10
-
-
-def test_step_change_in_twist_wing():
+    actual = np.array([FM["test_plane"]["total"][key] for key in KEYS])
+    np.testing.assert_allclose(actual, EXPECTED["tapered_wing"], rtol=0.0, atol=1e-10)
+
+
+@pytest.mark.slow
+def test_step_change_in_twist_wing(shared_airfoils):
     # Tests the NLL algorithm correctly calculates a wing with a step change in twist
 
     # Load input
-    input_dict, aircraft_name, aircraft_dict, state, control_state = MX.helpers.parse_input(input_file)
+    input_dict, aircraft_name, aircraft_dict, state, control_state = _parsed_input()
+    aircraft_dict["airfoils"] = shared_airfoils
 
     # Alter input
     input_dict["solver"]["type"] = "nonlinear"
@@ -385,16 +224,8 @@ def test_step_change_in_twist_wing():
     scene = MX.Scene(input_dict)
     scene.add_aircraft(aircraft_name, aircraft_dict, state=state, control_state=control_state)
     FM = scene.solve_forces(non_dimensional=True)
-    print(json.dumps(FM["test_plane"]["total"], indent=4))
-    assert abs(FM["test_plane"]["total"]["FL"]-28.36516174602864)<1e-10
-    assert abs(FM["test_plane"]["total"]["FD"]-2.996305717918925)<1e-10
-    assert abs(FM["test_plane"]["total"]["FS"])<1e-10
-    assert abs(FM["test_plane"]["total"]["Fx"]+2.004550580611607)<1e-10
-    assert abs(FM["test_plane"]["total"]["Fy"])<1e-10
-    assert abs(FM["test_plane"]["total"]["Fz"]+28.452452017416174)<1e-10
-    assert abs(FM["test_plane"]["total"]["Mx"])<1e-10
-    assert abs(FM["test_plane"]["total"]["My"]+18.71714165086305)<1e-10
-    assert abs(FM["test_plane"]["total"]["Mz"])<1e-10
+    actual = np.array([FM["test_plane"]["total"][key] for key in KEYS])
+    np.testing.assert_allclose(actual, EXPECTED["step_change_in_twist_wing"], rtol=0.0, atol=1e-10)
 
 
 def test_jackson_compare():
@@ -450,11 +281,12 @@ def test_jackson_compare():
     assert np.allclose(scene._gamma, correct_gamma)
 
 
+@pytest.mark.slow
 def test_swept_wing_with_aerodynamic_twist():
     # Tests for fix implemented 6/18/2021 based on a bug report from Julian Schmidt
 
     # Load input
-    input_dict, aircraft_name, aircraft_dict, state, control_state = MX.helpers.parse_input(input_file)
+    input_dict, aircraft_name, aircraft_dict, state, control_state = _parsed_input()
 
     # Alter input
     input_dict["solver"]["type"] = "nonlinear"
@@ -482,13 +314,5 @@ def test_swept_wing_with_aerodynamic_twist():
     scene = MX.Scene(input_dict)
     scene.add_aircraft(aircraft_name, aircraft_dict, state=state, control_state=control_state)
     FM = scene.solve_forces(non_dimensional=True, verbose=True)
-    print(json.dumps(FM["test_plane"]["total"], indent=4))
-    assert abs(FM["test_plane"]["total"]["FL"]+1.921431422738798)<1e-10
-    assert abs(FM["test_plane"]["total"]["FD"]-0.6730156268500228)<1e-10
-    assert abs(FM["test_plane"]["total"]["FS"])<1e-10
-    assert abs(FM["test_plane"]["total"]["Fx"]+0.622487790173485)<1e-10
-    assert abs(FM["test_plane"]["total"]["Fy"])<1e-10
-    assert abs(FM["test_plane"]["total"]["Fz"]-1.9383904914534897)<1e-10
-    assert abs(FM["test_plane"]["total"]["Mx"])<1e-10
-    assert abs(FM["test_plane"]["total"]["My"]-0.41401938251627074)<1e-10
-    assert abs(FM["test_plane"]["total"]["Mz"])<1e-10
\ No newline at end of file
+    actual = np.array([FM["test_plane"]["total"][key] for key in KEYS])
+    np.testing.assert_allclose(actual, EXPECTED["swept_wing_with_aerodynamic_twist"], rtol=0.0, atol=1e-10)
\ No newline at end of file
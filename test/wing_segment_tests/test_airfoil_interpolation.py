@@ -2,6 +2,7 @@
 
 import machupX as MX
 import numpy as np
+import pytest
 import json
 
 input_file = "test/input_for_testing.json"
@@ -191,4 +192,19 @@ def test_variable_airfoil_section_from_file_get_lift():
             if wing_segments[key].side == "left":
                 assert np.allclose(CL, CLs[i], rtol=0.0, atol=1e-8)
             else:
-                assert np.allclose(CL, CLs[i,::-1], rtol=0.0, atol=1e-8)
\ No newline at end of file
+                assert np.allclose(CL, CLs[i,::-1], rtol=0.0, atol=1e-8)
+
+def test_airfoil_distribution_must_span_segment():
+    # Tests an error is raised if the airfoil distribution does not reach the tip of the wing segment
+
+    # Load input
+    input_dict, airplane_name, airplane_dict, state, control_state = MX.helpers.parse_input(input_file)
+
+    # Alter input
+    airplane_dict["wings"]["main_wing"]["airfoil"] = [[0.0, "NACA_2410"],
+                                                      [0.7, "NACA_0010"]]
+
+    # Load scene
+    scene = MX.Scene(input_dict)
+    with pytest.raises(IOError):
+        scene.add_aircraft(airplane_name, airplane_dict, state=state, control_state=control_state)